@@ -75,6 +75,7 @@ def disable_nodes_activation_quantization(nodes: List[BaseNode]):
     for node in nodes:
         for qc in node.candidates_quantization_cfg:
             qc.activation_quantization_cfg.enable_activation_quantization = False
+            qc.activation_quantization_cfg.reset_hash()
 
 
 def fusion(graph: Graph, tpc: TargetPlatformCapabilities) -> Graph:
@@ -338,7 +338,7 @@ class BaseNode:
 
         if self.is_weights_quantization_enabled(kernel_attr):
             parameters_dict = copy.deepcopy(self.candidates_quantization_cfg[0].weights_quantization_cfg.
-                                            get_attr_config(kernel_attr).__dict__)
+                                            get_attr_config(kernel_attr).get_attributes_dict())
             for shared_parameter in shared_parameters:
                 if shared_parameter in parameters_dict:
                     unified_param = []
@@ -361,7 +361,7 @@ class BaseNode:
         shared_attributes = [ACTIVATION_NBITS_ATTRIBUTE]
         attr = dict()
         if self.is_activation_quantization_enabled():
-            attr = copy.deepcopy(self.candidates_quantization_cfg[0].activation_quantization_cfg.__dict__)
+            attr = copy.deepcopy(self.candidates_quantization_cfg[0].activation_quantization_cfg.get_attributes_dict())
             for shared_attr in shared_attributes:
                 if shared_attr in attr:
                     unified_attr = []
@@ -78,6 +78,7 @@ class VirtualSplitWeightsNode(VirtualSplitNode):
         for c in self.candidates_quantization_cfg:
             c.activation_quantization_cfg.enable_activation_quantization = False
             c.activation_quantization_cfg.activation_n_bits = FLOAT_BITWIDTH
+            c.activation_quantization_cfg.reset_hash()
 
 
 class VirtualSplitActivationNode(VirtualSplitNode):
@@ -105,9 +106,6 @@ class VirtualSplitActivationNode(VirtualSplitNode):
         self.layer_class = activation_class
 
         self.candidates_quantization_cfg = origin_node.get_unique_activation_candidates()
-        for c in self.candidates_quantization_cfg:
-            c.weights_quantization_cfg.enable_weights_quantization = False
-            c.weights_quantization_cfg.weights_n_bits = FLOAT_BITWIDTH
 
 
 class VirtualActivationWeightsNode(BaseNode):
@@ -266,6 +266,7 @@ class ChangeFinalActivationQuantizationMethod(BaseAction):
 
             node.final_activation_quantization_cfg.set_activation_quantization_fn(activation_quantization_fn)
             node.final_activation_quantization_cfg.activation_quantization_method = self.activation_quantization_method
+            node.final_activation_quantization_cfg.reset_hash()
 
 
 class ChangeCandidatesActivationQuantizationMethod(BaseAction):
@@ -309,6 +310,7 @@ class ChangeCandidatesActivationQuantizationMethod(BaseAction):
 
                 qc.activation_quantization_cfg.set_activation_quantization_fn(activation_quantization_fn)
                 qc.activation_quantization_cfg.activation_quantization_method = self.activation_quantization_method
+                qc.activation_quantization_cfg.reset_hash()
 
 
 class ChangeFinalWeightsQuantizationMethod(BaseAction):
@@ -358,6 +360,7 @@ class ChangeFinalWeightsQuantizationMethod(BaseAction):
              .set_weights_quantization_fn(weights_quantization_fn))
             node.final_weights_quantization_cfg.get_attr_config(self.attr_name).weights_quantization_method = \
                 self.weights_quantization_method
+            node.final_weights_quantization_cfg.get_attr_config(self.attr_name).reset_hash()
 
 
 class ChangeCandidatesWeightsQuantizationMethod(BaseAction):
@@ -405,6 +408,7 @@ class ChangeCandidatesWeightsQuantizationMethod(BaseAction):
 
                 attr_qc.set_weights_quantization_fn(weights_quantization_fn)
                 attr_qc.weights_quantization_method = self.weights_quantization_method
+                attr_qc.reset_hash()
 
 
 class ReplaceLayer(BaseAction):
@@ -97,11 +97,13 @@ def filter_node_candidates(node: BaseNode, fw_info) -> List[CandidateNodeQuantiz
         single_dummy_candidate = filtered_candidates[0]
         single_dummy_candidate.activation_quantization_cfg.activation_n_bits = FLOAT_BITWIDTH
         single_dummy_candidate.activation_quantization_cfg.activation_quantization_method = QuantizationMethod.POWER_OF_TWO
+        single_dummy_candidate.activation_quantization_cfg.reset_hash()
 
         if kernel_attr is not None:
             kernel_config = single_dummy_candidate.weights_quantization_cfg.get_attr_config(kernel_attr)
             kernel_config.weights_n_bits = FLOAT_BITWIDTH
             kernel_config.weights_quantization_method = QuantizationMethod.POWER_OF_TWO
+            kernel_config.reset_hash()
 
         final_candidates = [single_dummy_candidate]
 
@@ -116,6 +118,7 @@ def filter_node_candidates(node: BaseNode, fw_info) -> List[CandidateNodeQuantiz
         for c in filtered_candidates:
             c.activation_quantization_cfg.activation_n_bits = FLOAT_BITWIDTH
             c.activation_quantization_cfg.activation_quantization_method = QuantizationMethod.POWER_OF_TWO
+            c.activation_quantization_cfg.reset_hash()
 
         final_candidates = _filter_bit_method_dups(filtered_candidates, kernel_attr)
 
@@ -132,6 +135,7 @@ def filter_node_candidates(node: BaseNode, fw_info) -> List[CandidateNodeQuantiz
                 kernel_config = c.weights_quantization_cfg.get_attr_config(kernel_attr)
                 kernel_config.weights_n_bits = FLOAT_BITWIDTH
                 kernel_config.weights_quantization_method = QuantizationMethod.POWER_OF_TWO
+                kernel_config.reset_hash()
 
         final_candidates = _filter_bit_method_dups(filtered_candidates, kernel_attr)
 
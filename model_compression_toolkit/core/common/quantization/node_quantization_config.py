@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
-
+import copy
 from typing import Callable, Any, List, Tuple, Union, Dict
 
 import numpy as np
@@ -36,11 +36,84 @@ from model_compression_toolkit.target_platform_capabilities.target_platform impo
 ##########################################
 
 
+class _HashCachingConfig(object):
+    """
+    Mixin for configuration classes that cache the result of __hash__.
+    Configs are hashed when node candidates are deduplicated (e.g., in filter_nodes_candidates), and the hashed
+    configs remain the node's candidates afterwards. A stale cached hash makes __eq__ return False, so the config
+    setters drop the cached hash, and any code that directly assigns an attribute that takes part in the hash
+    must call reset_hash afterwards.
+    Attributes listed in _cache_attrs hold cached values and are not part of the config's attributes.
+    """
+
+    __slots__ = ()
+
+    _cache_attrs = ('_hash',)
+
+    def reset_hash(self):
+        """
+        Drops the cached hash, so it is recomputed on the next call to __hash__.
+        """
+        self._hash = None
+
+    def get_attributes_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary that maps the config attributes names to their values.
+        """
+        return {k: getattr(self, k) for k in self.__slots__ if k not in self._cache_attrs and hasattr(self, k)}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns: The object's state without cached values, which are not valid in a copied or unpickled object.
+        """
+        state = {k: getattr(self, k) for k in self.__slots__ if hasattr(self, k)}
+        state.update(dict.fromkeys(self._cache_attrs))
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """
+        Restores the object's state.
+
+        Args:
+            state: The object's state as returned from __getstate__.
+
+        """
+        for k, v in state.items():
+            object.__setattr__(self, k, v)
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        """
+        Copies the object's attributes directly into a new object, without building an intermediate state.
+
+        Args:
+            memo: The deepcopy memo dictionary.
+
+        Returns: A deep copy of the object, without cached values.
+
+        """
+        new_obj = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_obj
+        for k in self.__slots__:
+            if hasattr(self, k):
+                object.__setattr__(new_obj, k, copy.deepcopy(getattr(self, k), memo))
+        for k in self._cache_attrs:
+            object.__setattr__(new_obj, k, None)
+        return new_obj
+
+
 class BaseNodeQuantizationConfig(object):
     """
     Base class for node quantization configuration
     """
 
+    __slots__ = ()
+
+    def get_attributes_dict(self) -> Dict[str, Any]:
+        """
+        Returns: A dictionary that maps the config attributes names to their values.
+        """
+        return dict(self.__dict__)
+
     def set_quant_config_attr(self, config_parameter_name: str, config_parameter_value: Any,
                               *args: List[Any], **kwargs: Dict[str, Any]):
         """
@@ -66,13 +139,33 @@ class BaseNodeQuantizationConfig(object):
         Returns: String to display a NodeQuantizationConfig object.
         """
         # Used for debugging, thus no cover.
-        return ''.join(f'{k}: {v}\n' for k, v in self.__dict__.items())  # pragma: no cover
+        return '\n'.join(f'{k}: {v}' for k, v in self.get_attributes_dict().items())  # pragma: no cover
 
 
-class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
+class NodeActivationQuantizationConfig(_HashCachingConfig, BaseNodeQuantizationConfig):
     """
     Attributes for configuring the quantization of the activations of a node.
     """
+
+    __slots__ = ('_hash',
+                 'activation_quantization_fn',
+                 'activation_quantization_params_fn',
+                 'activation_quantization_params',
+                 'activation_quantization_method',
+                 '_activation_error_method',
+                 'activation_n_bits',
+                 'relu_bound_to_power_of_2',
+                 'enable_activation_quantization',
+                 'activation_channel_equalization',
+                 'input_scaling',
+                 'min_threshold',
+                 'l_p_value',
+                 'shift_negative_activation_correction',
+                 'z_threshold',
+                 'shift_negative_ratio',
+                 'shift_negative_threshold_recalculation',
+                 'concat_threshold_update')
+
     def __init__(self,
                  qc: QuantizationConfig,
                  op_cfg: OpQuantizationConfig,
@@ -88,6 +181,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
             activation_quantization_params_fn: Function to use when computing the threshold for quantizing a node's activations.
         """
 
+        self._hash = None
         self.activation_quantization_fn = activation_quantization_fn
         self.activation_quantization_params_fn = activation_quantization_params_fn
         self.activation_quantization_params = {}
@@ -144,6 +238,24 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         """
         self._activation_error_method = value
         self.activation_quantization_params_fn = get_activation_quantization_params_fn(activation_quantization_method=self.activation_quantization_method)
+        self._hash = None
+
+    def set_quant_config_attr(self, config_parameter_name: str, config_parameter_value: Any,
+                              *args: List[Any], **kwargs: Dict[str, Any]):
+        """
+        This method overrides the parent class set_quant_config_attr to drop the cached hash of the config.
+
+        Args:
+            config_parameter_name: parameter name to change.
+            config_parameter_value: parameter value to change.
+            args: A list of additional arguments.
+            kwargs: A dictionary with additional key arguments.
+
+        """
+        super(NodeActivationQuantizationConfig, self).set_quant_config_attr(config_parameter_name,
+                                                                            config_parameter_value,
+                                                                            *args, **kwargs)
+        self._hash = None
 
     def set_activation_quantization_fn(self, activation_quantization_fn: Callable):
         """
@@ -154,6 +266,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
 
         """
         self.activation_quantization_fn = activation_quantization_fn
+        self._hash = None
 
     def set_activation_quantization_params_fn(self, activation_quantization_params_fn:Callable):
         """
@@ -164,6 +277,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
 
         """
         self.activation_quantization_params_fn = activation_quantization_params_fn
+        self._hash = None
 
     def set_activation_quantization_param(self,
                                           activation_params: dict):
@@ -175,8 +289,7 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
 
         """
         assert self.enable_activation_quantization
-        for param_name, param_value in activation_params.items():
-            self.activation_quantization_params[param_name] = param_value
+        self.activation_quantization_params.update(activation_params)
 
     def has_activation_quantization_params(self) -> bool:
         """
@@ -202,9 +315,16 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
         Returns: Whether the objects are identical or not.
 
         """
+        if self is other:
+            return True
+
         if not isinstance(other, NodeActivationQuantizationConfig):
             return False
 
+        # Configs with different cached hashes can't be equal, so skip the attribute-by-attribute comparison
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+
         return self.activation_quantization_fn == other.activation_quantization_fn and \
                self.activation_quantization_params_fn == other.activation_quantization_params_fn and \
                self.activation_error_method == other.activation_error_method and \
@@ -221,26 +341,41 @@ class NodeActivationQuantizationConfig(BaseNodeQuantizationConfig):
                self.shift_negative_threshold_recalculation == other.shift_negative_threshold_recalculation 
 
     def __hash__(self):
-        return hash((self.activation_quantization_fn,
-                     self.activation_quantization_params_fn,
-                     self.activation_error_method,
-                     self.activation_quantization_method,
-                     self.activation_n_bits,
-                     self.enable_activation_quantization,
-                     self.activation_channel_equalization,
-                     self.input_scaling,
-                     self.min_threshold,
-                     self.l_p_value,
-                     self.shift_negative_activation_correction,
-                     self.z_threshold,
-                     self.shift_negative_ratio,
-                     self.shift_negative_threshold_recalculation))
-
-
-class WeightsAttrQuantizationConfig:
+        if self._hash is None:
+            self._hash = hash((self.activation_quantization_fn,
+                               self.activation_quantization_params_fn,
+                               self.activation_error_method,
+                               self.activation_quantization_method,
+                               self.activation_n_bits,
+                               self.enable_activation_quantization,
+                               self.activation_channel_equalization,
+                               self.input_scaling,
+                               self.min_threshold,
+                               self.l_p_value,
+                               self.shift_negative_activation_correction,
+                               self.z_threshold,
+                               self.shift_negative_ratio,
+                               self.shift_negative_threshold_recalculation))
+        return self._hash
+
+
+class WeightsAttrQuantizationConfig(_HashCachingConfig):
     """
     Configuration for quantizing a weights attribute of a node.
     """
+
+    __slots__ = ('_hash',
+                 'weights_quantization_fn',
+                 'weights_quantization_params_fn',
+                 'weights_channels_axis',
+                 'weights_quantization_params',
+                 'weights_quantization_method',
+                 '_weights_error_method',
+                 'weights_n_bits',
+                 'weights_per_channel_threshold',
+                 'enable_weights_quantization',
+                 'l_p_value')
+
     def __init__(self,
                  qc: QuantizationConfig,
                  weights_attr_cfg: AttributeQuantizationConfig,
@@ -252,6 +387,7 @@ class WeightsAttrQuantizationConfig:
             weights_attr_cfg: AttributeQuantizationConfig with parameters to use when creating the node's attribute quantization config.
             weights_channels_axis: Axis to quantize a node's attribute when quantizing per-channel (if not quantizing per-channel than expecting None).
         """
+        self._hash = None
         self.weights_quantization_fn = get_weights_quantization_fn(weights_attr_cfg.weights_quantization_method)
         self.weights_quantization_params_fn = get_weights_quantization_params_fn(weights_attr_cfg.weights_quantization_method)
         self.weights_channels_axis = weights_channels_axis
@@ -281,6 +417,7 @@ class WeightsAttrQuantizationConfig:
         """
         self._weights_error_method = value
         self.weights_quantization_params_fn = get_weights_quantization_params_fn(weights_quantization_method=self.weights_quantization_method)
+        self._hash = None
 
     def set_weights_quantization_fn(self, weights_quantization_fn: Callable):
         """
@@ -291,6 +428,7 @@ class WeightsAttrQuantizationConfig:
 
         """
         self.weights_quantization_fn = weights_quantization_fn
+        self._hash = None
 
     def set_weights_quantization_params_fn(self, weights_quantization_params_fn: Callable):
         """
@@ -301,6 +439,7 @@ class WeightsAttrQuantizationConfig:
 
         """
         self.weights_quantization_params_fn = weights_quantization_params_fn
+        self._hash = None
 
     def set_weights_quantization_param(self,
                                        weights_params: dict):
@@ -312,8 +451,7 @@ class WeightsAttrQuantizationConfig:
 
         """
         assert self.enable_weights_quantization
-        for param_name, param_value in weights_params.items():
-            self.weights_quantization_params[param_name] = param_value
+        self.weights_quantization_params.update(weights_params)
 
     def calculate_and_set_weights_params(self, tensor_data: np.ndarray, min_threshold: float):
         """
@@ -354,9 +492,16 @@ class WeightsAttrQuantizationConfig:
         Returns: Whether the objects are identical or not.
 
         """
+        if self is other:
+            return True
+
         if not isinstance(other, WeightsAttrQuantizationConfig):
             return False
 
+        # Configs with different cached hashes can't be equal, so skip the attribute-by-attribute comparison
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+
         return self.weights_quantization_fn == other.weights_quantization_fn and \
                self.weights_quantization_params_fn == other.weights_quantization_params_fn and \
                self.weights_channels_axis == other.weights_channels_axis and \
@@ -368,22 +513,39 @@ class WeightsAttrQuantizationConfig:
                self.l_p_value == other.l_p_value
 
     def __hash__(self):
-        return hash((self.weights_quantization_fn,
-                     self.weights_quantization_params_fn,
-                     self.weights_channels_axis,
-                     self.weights_error_method,
-                     self.weights_quantization_method,
-                     self.weights_n_bits,
-                     self.weights_per_channel_threshold,
-                     self.enable_weights_quantization,
-                     self.l_p_value))
-
-
-class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
+        if self._hash is None:
+            self._hash = hash((self.weights_quantization_fn,
+                               self.weights_quantization_params_fn,
+                               self.weights_channels_axis,
+                               self.weights_error_method,
+                               self.weights_quantization_method,
+                               self.weights_n_bits,
+                               self.weights_per_channel_threshold,
+                               self.enable_weights_quantization,
+                               self.l_p_value))
+        return self._hash
+
+
+class NodeWeightsQuantizationConfig(_HashCachingConfig, BaseNodeQuantizationConfig):
     """
     Holding a mapping between the node's weights attributes and their quantization configurations,
     in addition to quantization parameters that are global for all attributes of the represented node.
     """
+
+    # bias_corrected is set only when bias correction is computed for the node
+    __slots__ = ('_hash',
+                 '_attr_keys_frozen',
+                 '_pos_attr_keys_frozen',
+                 'min_threshold',
+                 'simd_size',
+                 'weights_second_moment_correction',
+                 'weights_bias_correction',
+                 'attributes_config_mapping',
+                 'pos_attributes_config_mapping',
+                 'bias_corrected')
+
+    _cache_attrs = ('_hash', '_attr_keys_frozen', '_pos_attr_keys_frozen')
+
     def __init__(self, qc: QuantizationConfig,
                  op_cfg: OpQuantizationConfig,
                  weights_channels_axis: Tuple[int, int],
@@ -397,6 +559,9 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
             node_attrs_list: A list of the node's weights attributes names.
 
         """
+        self._hash = None
+        self._attr_keys_frozen = None
+        self._pos_attr_keys_frozen = None
         self.min_threshold = qc.min_threshold
         self.simd_size = op_cfg.simd_size
         self.weights_second_moment_correction = qc.weights_second_moment_correction
@@ -405,6 +570,7 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
         # Initialize a quantization configuration for each of the node's attributes
         self.attributes_config_mapping = {}
         self.pos_attributes_config_mapping = {}
+        attr_weights_configs_items = tuple(op_cfg.attr_weights_configs_mapping.items())
         for attr in node_attrs_list:
             if isinstance(attr, int):
                 # this is a positional attribute, so it needs to be handled separately.
@@ -414,7 +580,7 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
             else:
                 # In Tensorflow, the attribute name is composed of the framework attribute name and the layer name,
                 # therefore, we need to look for the attribute in the op_cfg that is contained in the node attribute's name.
-                attrs_included_in_name = {k: v for k, v in op_cfg.attr_weights_configs_mapping.items() if k in attr}
+                attrs_included_in_name = [v for k, v in attr_weights_configs_items if k in attr]
                 if len(attrs_included_in_name) > 1:
                     Logger.error(f"Found multiple attribute in TPC OpConfig that are contained "
                                  f"in the attribute name '{attr}'."
@@ -423,12 +589,20 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
                 if len(attrs_included_in_name) == 0:
                     attr_cfg = op_cfg.default_weight_attr_config
                 else:
-                    attr_cfg = list(attrs_included_in_name.values())[0]
+                    attr_cfg = attrs_included_in_name[0]
 
                 self.attributes_config_mapping[attr] = WeightsAttrQuantizationConfig(qc=qc,
                                                                                      weights_attr_cfg=attr_cfg,
                                                                                      weights_channels_axis=weights_channels_axis)
 
+    def reset_hash(self):
+        """
+        Drops the cached hash and the cached attributes names, so they are recomputed on the next call to __hash__.
+        """
+        self._hash = None
+        self._attr_keys_frozen = None
+        self._pos_attr_keys_frozen = None
+
     def get_attr_config(self, attr_name: Union[str, int]) -> WeightsAttrQuantizationConfig:
         """
         Returns a weights attribute config for an attribute that contains the given name.
@@ -445,22 +619,35 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
         if attr_name is None:
             Logger.error("Got 'None' attribute name for retrieving weights attribute quantization configuration.")
 
+        attr_cfg = self._find_attr_config(attr_name)
+        if attr_cfg is None:
+            Logger.error(f"Weight attribute '{attr_name}' config could not be found.")
+
+        return attr_cfg
+
+    def _find_attr_config(self, attr_name: Union[str, int]) -> Union[WeightsAttrQuantizationConfig, None]:
+        """
+        Looks for a weights attribute config for an attribute that contains the given name.
+        If multiple attributes that contain the given name are found - looking for the exact name.
+
+        Args:
+            attr_name: The name of the attribute to get its quantization configuration.
+
+        Returns: An attribute quantization configuration, or None if no matching attribute was found.
+
+        """
         if isinstance(attr_name, int):
             # this is a positional attribute
-            attr_cfg = self.pos_attributes_config_mapping.get(attr_name)
-        else:
-            attrs_with_name = self._extract_config_for_attributes_with_name(attr_name)
-            attr_cfg = None
-            if len(attrs_with_name) == 1:
-                attr_cfg = [v for v in attrs_with_name.values()][0]
-            elif len(attrs_with_name) > 1:
-                Logger.warning(f"Found multiple weight attributes containing the name {attr_name}: "
-                               f"{list(attrs_with_name.keys())}. Looking for an attributes with the exact name.")
-                # If no attribute with the exact name then an error would be thrown
-                attr_cfg = self.attributes_config_mapping.get(attr_name)
+            return self.pos_attributes_config_mapping.get(attr_name)
 
-        if attr_cfg is None:
-            Logger.error(f"Weight attribute '{attr_name}' config could not be found.")
+        attrs_with_name = self._extract_config_for_attributes_with_name(attr_name)
+        attr_cfg = None
+        if len(attrs_with_name) == 1:
+            attr_cfg = next(iter(attrs_with_name.values()))
+        elif len(attrs_with_name) > 1:
+            Logger.warning(f"Found multiple weight attributes containing the name {attr_name}: "
+                           f"{list(attrs_with_name.keys())}. Looking for an attributes with the exact name.")
+            attr_cfg = self.attributes_config_mapping.get(attr_name)
 
         return attr_cfg
 
@@ -473,10 +660,15 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
             attr_qc: The quantization configuration to set.
 
         """
+        # The attributes names take part in the hash, so a new attribute invalidates the cached hash
         if isinstance(attr_name, int):
             self.pos_attributes_config_mapping[attr_name] = attr_qc
+            self._pos_attr_keys_frozen = None
         else:
             self.attributes_config_mapping[attr_name] = attr_qc
+            self._attr_keys_frozen = None
+
+        self._hash = None
 
     def has_attribute_config(self, attr_name: Union[str, int]) -> bool:
         """
@@ -489,13 +681,9 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
 
         """
         if isinstance(attr_name, int):
-            return self.pos_attributes_config_mapping.get(attr_name, False)
-        else:
-            saved_attr_name = self._extract_config_for_attributes_with_name(attr_name)
-            if len(saved_attr_name) >= 1:
-                return True
+            return attr_name in self.pos_attributes_config_mapping
 
-        return False
+        return any(attr_name in k for k in self.attributes_config_mapping)
 
     def _extract_config_for_attributes_with_name(self, attr_name) -> Dict[str, WeightsAttrQuantizationConfig]:
         """
@@ -534,16 +722,17 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
             super(NodeWeightsQuantizationConfig, self).set_quant_config_attr(config_parameter_name,
                                                                              config_parameter_value,
                                                                              *args, **kwargs)
+            self._hash = None
         else:
-            if self.has_attribute_config(attr_name):
-                attr_cfg = self.get_attr_config(attr_name)
-                if hasattr(attr_cfg, config_parameter_name):
-                    setattr(attr_cfg, config_parameter_name, config_parameter_value)
-                else:
-                    Logger.warning(f"Parameter {config_parameter_name} could not be found in the node quantization config of "
-                                   f"weights attribute {attr_name} and was not updated!")
-            else:
+            attr_cfg = self._find_attr_config(attr_name)
+            if attr_cfg is None:
                 Logger.error(f"Weights attribute {attr_name} could not be found to set parameter {config_parameter_name}.")
+            elif hasattr(attr_cfg, config_parameter_name):
+                setattr(attr_cfg, config_parameter_name, config_parameter_value)
+                attr_cfg.reset_hash()
+            else:
+                Logger.warning(f"Parameter {config_parameter_name} could not be found in the node quantization config of "
+                               f"weights attribute {attr_name} and was not updated!")
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -555,24 +744,37 @@ class NodeWeightsQuantizationConfig(BaseNodeQuantizationConfig):
         Returns: Whether the objects are identical or not.
 
         """
+        if self is other:
+            return True
+
         if not isinstance(other, NodeWeightsQuantizationConfig):
             return False
 
+        # Configs with different cached hashes can't be equal, so skip the attribute-by-attribute comparison
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+
         return self.min_threshold == other.min_threshold and \
             self.simd_size == other.simd_size and \
             self.weights_second_moment_correction == other.weights_second_moment_correction and \
             self.weights_bias_correction == other.weights_bias_correction and \
             self.attributes_config_mapping.keys() == other.attributes_config_mapping.keys() and \
-            all([self.attributes_config_mapping[k] == other.attributes_config_mapping[k]
-                 for k in self.attributes_config_mapping.keys()]) and \
+            all(self.attributes_config_mapping[k] == other.attributes_config_mapping[k]
+                for k in self.attributes_config_mapping.keys()) and \
             self.pos_attributes_config_mapping.keys() == other.pos_attributes_config_mapping.keys() and \
-            all([self.pos_attributes_config_mapping[k] == other.pos_attributes_config_mapping[k]
-                 for k in self.pos_attributes_config_mapping.keys()])
+            all(self.pos_attributes_config_mapping[k] == other.pos_attributes_config_mapping[k]
+                for k in self.pos_attributes_config_mapping.keys())
 
     def __hash__(self):
-        return hash((self.min_threshold,
-                     self.simd_size,
-                     self.weights_second_moment_correction,
-                     self.weights_bias_correction,
-                     frozenset(self.attributes_config_mapping),
-                     frozenset(self.pos_attributes_config_mapping)))
+        if self._hash is None:
+            if self._attr_keys_frozen is None:
+                self._attr_keys_frozen = frozenset(self.attributes_config_mapping)
+            if self._pos_attr_keys_frozen is None:
+                self._pos_attr_keys_frozen = frozenset(self.pos_attributes_config_mapping)
+            self._hash = hash((self.min_threshold,
+                               self.simd_size,
+                               self.weights_second_moment_correction,
+                               self.weights_bias_correction,
+                               self._attr_keys_frozen,
+                               self._pos_attr_keys_frozen))
+        return self._hash
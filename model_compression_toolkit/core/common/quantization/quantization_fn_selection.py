@@ -14,7 +14,7 @@
 # ==============================================================================
 
 from collections.abc import Callable
-from functools import partial
+from functools import partial, lru_cache
 
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
@@ -23,6 +23,7 @@ from model_compression_toolkit.core.common.quantization.quantizers.uniform_quant
     symmetric_quantizer, uniform_quantizer
 
 
+@lru_cache(maxsize=None)
 def get_weights_quantization_fn(weights_quantization_method: QuantizationMethod) -> Callable:
     """
     Generate a function for weight quantization.
@@ -14,7 +14,7 @@
 # ==============================================================================
 
 from collections.abc import Callable
-from functools import partial
+from functools import partial, lru_cache
 
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
@@ -28,6 +28,7 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     power_of_two_selection_tensor, power_of_two_selection_histogram
 
 
+@lru_cache(maxsize=None)
 def get_activation_quantization_params_fn(activation_quantization_method: QuantizationMethod) -> Callable:
     """
     Generate a function for finding activation quantization parameters.
@@ -52,6 +53,7 @@ def get_activation_quantization_params_fn(activation_quantization_method: Quanti
     return params_fn
 
 
+@lru_cache(maxsize=None)
 def get_weights_quantization_params_fn(weights_quantization_method: QuantizationMethod) -> Callable:
     """
     Generate a function for finding weights quantization parameters.
@@ -64,6 +64,7 @@ def get_activations_qparams(activation_quant_cfg: NodeActivationQuantizationConf
         elif activation_quant_cfg.activation_quantization_method == QuantizationMethod.UNIFORM:
             activation_quant_cfg.activation_quantization_params_fn = \
                 quantization_params_generation.uniform_no_clipping_selection_min_max
+        activation_quant_cfg.reset_hash()
 
     activation_params = activation_quant_cfg.activation_quantization_params_fn(bins_values,
                                                                                bins_counts,
@@ -105,6 +105,7 @@ def set_quantization_configs_to_node(node: BaseNode,
     for candidate_qc in node.candidates_quantization_cfg:
         candidate_qc.activation_quantization_cfg.enable_activation_quantization = \
             candidate_qc.activation_quantization_cfg.enable_activation_quantization and node.get_has_activation()
+        candidate_qc.activation_quantization_cfg.reset_hash()
 
 
 def create_node_activation_qc(qc: QuantizationConfig,
@@ -53,6 +53,7 @@ def compute_bias_correction_of_graph(graph: Graph,
                 if n.has_positional_weights:
                     for candidate_qc in n.candidates_quantization_cfg:
                         candidate_qc.weights_quantization_cfg.weights_bias_correction = False
+                        candidate_qc.weights_quantization_cfg.reset_hash()
                 else:
                     _compute_bias_correction_per_candidate_qc(n,
                                                               kernel_attr,
@@ -85,12 +85,14 @@ class BatchNormalizationReconstruction(common.BaseSubstitution):
         if source_node.is_reused():
             for qc in source_node.candidates_quantization_cfg:
                 qc.weights_quantization_cfg.weights_second_moment_correction = False
+                qc.weights_quantization_cfg.reset_hash()
             return graph
 
         # We apply only on nodes with folded BatchNormalization.
         if source_node.prior_info.std_output is None or source_node.prior_info.mean_output is None:
             for qc in source_node.candidates_quantization_cfg:
                 qc.weights_quantization_cfg.weights_second_moment_correction = False
+                qc.weights_quantization_cfg.reset_hash()
             return graph
 
         # This feature disabled for models with weights quantization method of Power of 2
@@ -105,6 +107,7 @@ class BatchNormalizationReconstruction(common.BaseSubstitution):
                                "quantization method of Power of 2")
                 for qc_inner in source_node.candidates_quantization_cfg:
                     qc_inner.weights_quantization_cfg.weights_second_moment_correction = False
+                    qc_inner.weights_quantization_cfg.reset_hash()
                 return graph
 
         eps = self.epsilon_val
@@ -128,11 +131,13 @@ class BatchNormalizationReconstruction(common.BaseSubstitution):
 
         for qc in bn_node.candidates_quantization_cfg:
             qc.activation_quantization_cfg.enable_activation_quantization = False
+            qc.activation_quantization_cfg.reset_hash()
             for attr in bn_node.get_node_weights_attributes():
                 if qc.weights_quantization_cfg.has_attribute_config(attr):
                     # we only create a BN layer to collect statistics, so we don't need to quantize anything,
                     # but we do need to add the BN attributes to the reconstructed node.
                     qc.weights_quantization_cfg.get_attr_config(attr).enable_weights_quantization = False
+                    qc.weights_quantization_cfg.get_attr_config(attr).reset_hash()
                 else:
                     # setting a "dummy" attribute configuration with disabled quantization.
                     # TODO: once enabling BN attributes quantization, need to figure out if thie
@@ -358,8 +358,10 @@ def shift_negative_function(graph: Graph,
 
         for candidate_qc in pad_node.candidates_quantization_cfg:
             candidate_qc.activation_quantization_cfg.enable_activation_quantization = False
+            candidate_qc.activation_quantization_cfg.reset_hash()
             for attr in pad_node.get_node_weights_attributes():
                 candidate_qc.weights_quantization_cfg.get_attr_config(attr).enable_weights_quantization = False
+                candidate_qc.weights_quantization_cfg.get_attr_config(attr).reset_hash()
 
         # Insert a pad node between the add node to the op2d, and create statistics for the pad node
         insert_node_before_node(graph,
@@ -381,6 +383,7 @@ def shift_negative_function(graph: Graph,
     # The non-linear node's output should be float, so we approximate it by using 16bits quantization.
     for candidate_qc in non_linear_node.candidates_quantization_cfg:
         candidate_qc.activation_quantization_cfg.activation_n_bits = SHIFT_NEGATIVE_NON_LINEAR_NUM_BITS
+        candidate_qc.activation_quantization_cfg.reset_hash()
 
     # A bypass node that has its own activation (e.g. GlobalAvgPool2D) can set it to unsigned
     if bypass_nodes:
@@ -394,6 +397,7 @@ def shift_negative_function(graph: Graph,
     for op_qc_idx, candidate_qc in enumerate(add_node.candidates_quantization_cfg):
         for attr in add_node.get_node_weights_attributes():
             candidate_qc.weights_quantization_cfg.get_attr_config(attr).enable_weights_quantization = False
+            candidate_qc.weights_quantization_cfg.get_attr_config(attr).reset_hash()
 
         candidate_qc.activation_quantization_cfg = create_node_activation_qc(core_config.quantization_config,
                                                                              fw_info,
@@ -402,6 +406,7 @@ def shift_negative_function(graph: Graph,
         candidate_qc.activation_quantization_cfg.set_activation_quantization_param({THRESHOLD: activation_threshold,
                                                                                     SIGNED: False})
         candidate_qc.activation_quantization_cfg.activation_n_bits = original_non_linear_activation_nbits
+        candidate_qc.activation_quantization_cfg.reset_hash()
 
     if non_linear_node_cfg_candidate.shift_negative_threshold_recalculation:
         activation_param = get_activations_qparams(activation_quant_cfg=non_linear_node_cfg_candidate,
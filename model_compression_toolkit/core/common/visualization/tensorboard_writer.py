@@ -206,7 +206,7 @@ class TensorboardWriter(object):
             """
             attr = dict()
             if n.final_activation_quantization_cfg is not None:
-                attr.update(n.final_activation_quantization_cfg.__dict__)
+                attr.update(n.final_activation_quantization_cfg.get_attributes_dict())
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_activation_candidates_dict())
             return attr
@@ -228,7 +228,7 @@ class TensorboardWriter(object):
             # Log final config or unified candidates, not both
             attr = dict()
             if n.final_weights_quantization_cfg is not None:
-                attr.update(n.final_weights_quantization_cfg.__dict__)
+                attr.update(n.final_weights_quantization_cfg.get_attributes_dict())
             elif n.candidates_quantization_cfg is not None:
                 attr.update(n.get_unified_weights_candidates_dict(self.fw_info))
             return attr
@@ -55,12 +55,19 @@ class ConcatThresholdUpdate(common.BaseSubstitution):
             Graph after applying the substitution.
         """
     
-        if len(node.candidates_quantization_cfg) == 1 and THRESHOLD in node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params:
-            concat_threshold = node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params[THRESHOLD]
-            prev_nodes = graph.get_prev_nodes(node)
-            for prev_node in prev_nodes:
-                if len(graph.get_next_nodes(prev_node))==1 and prev_node.type != torch.cat and prev_node.type != torch.concat:
-                    prev_node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params[THRESHOLD] = concat_threshold
+        if len(node.candidates_quantization_cfg) != 1:
+            return graph
+
+        concat_threshold = node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params.get(THRESHOLD)
+        if concat_threshold is None:
+            return graph
+
+        get_next_nodes = graph.get_next_nodes
+        for prev_node in graph.get_prev_nodes(node):
+            if len(get_next_nodes(prev_node)) == 1 and prev_node.type != torch.cat and prev_node.type != torch.concat:
+                prev_params = prev_node.candidates_quantization_cfg[0].activation_quantization_cfg.activation_quantization_params
+                if prev_params.get(THRESHOLD) != concat_threshold:
+                    prev_params[THRESHOLD] = concat_threshold
 
         return graph
 
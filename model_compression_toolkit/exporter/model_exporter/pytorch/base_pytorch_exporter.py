@@ -35,12 +35,13 @@ def _set_quantized_weights_in_wrapper(layer:PytorchQuantizationWrapper):
     """
     assert isinstance(layer, PytorchQuantizationWrapper), f' Expected module {layer} to be PytorchQuantizationWrapper but is of type {type(layer)}'
 
-    # Replace the weights in the layer with quantized weights
+    # Replace the weights in the layer with quantized weights. The quantized weights of all attributes are
+    # computed once, since get_quantized_weights runs all the layer's weights quantizers.
+    quantized_weights = layer.get_quantized_weights()
+    linear_layer = getattr(layer, LAYER)
     for name in layer.weights_quantizers.keys():
-        quantized_weight = torch.nn.Parameter(layer.get_quantized_weights()[name]).detach()
-        linear_layer = getattr(layer, LAYER)
         delattr(linear_layer, name)
-        setattr(linear_layer, name, torch.nn.Parameter(quantized_weight))
+        setattr(linear_layer, name, torch.nn.Parameter(quantized_weights[name].detach()))
 
     # Clear the weights quantizers dictionary
     layer.weights_quantizers = {}
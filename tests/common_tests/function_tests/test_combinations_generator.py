@@ -0,0 +1,37 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+import unittest
+
+from tests.common_tests.helpers.combinations_generator import pairwise_combinations
+
+
+class TestCombinationsGenerator(unittest.TestCase):
+
+    def test_pairwise_covers_all_pairs(self):
+        config_list = [[0, 1, 2], ['a', 'b', 'c', 'd'], [True, False], [True, False], [True, False]]
+        combinations = list(pairwise_combinations(config_list))
+        self.assertLess(len(combinations), len(list(itertools.product(*config_list))))
+
+        for i, j in itertools.combinations(range(len(config_list)), 2):
+            covered_pairs = {(c[i], c[j]) for c in combinations}
+            self.assertEqual(covered_pairs, set(itertools.product(config_list[i], config_list[j])))
+
+    def test_single_parameter(self):
+        self.assertEqual(list(pairwise_combinations([[1, 2, 3]])), [(1,), (2,), (3,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
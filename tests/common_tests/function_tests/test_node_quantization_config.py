@@ -0,0 +1,159 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import pickle
+import unittest
+
+from model_compression_toolkit.core import QuantizationConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.fusion.layer_fusing import disable_nodes_activation_quantization
+from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
+    CandidateNodeQuantizationConfig
+from model_compression_toolkit.core.common.quantization.filter_nodes_candidates import filter_node_candidates
+from model_compression_toolkit.core.common.quantization.node_quantization_config import \
+    NodeActivationQuantizationConfig, NodeWeightsQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_params_fn_selection import \
+    get_activation_quantization_params_fn
+from model_compression_toolkit.core.common.quantization.quantizers.uniform_quantizers import power_of_two_quantizer
+from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR, BIAS_ATTR
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_attr_configs, generate_test_op_qc
+
+TEST_QC = QuantizationConfig()
+TEST_OP_QC = generate_test_op_qc(**generate_test_attr_configs())
+
+
+def _activation_config():
+    return NodeActivationQuantizationConfig(qc=TEST_QC,
+                                            op_cfg=TEST_OP_QC,
+                                            activation_quantization_fn=power_of_two_quantizer,
+                                            activation_quantization_params_fn=get_activation_quantization_params_fn(
+                                                QuantizationMethod.POWER_OF_TWO))
+
+
+def _weights_config():
+    return NodeWeightsQuantizationConfig(qc=TEST_QC,
+                                         op_cfg=TEST_OP_QC,
+                                         weights_channels_axis=(0, 1),
+                                         node_attrs_list=[KERNEL_ATTR, BIAS_ATTR])
+
+
+class _NoKernelFwInfo:
+    def get_kernel_op_attributes(self, node_type):
+        return [None]
+
+
+class TestNodeQuantizationConfig(unittest.TestCase):
+
+    def test_activation_config_hash_invalidation(self):
+        cfg = _activation_config()
+        other = _activation_config()
+        self.assertEqual(hash(cfg), hash(other))
+        self.assertEqual(cfg, other)
+
+        cfg.set_quant_config_attr('activation_n_bits', 4)
+        self.assertNotEqual(hash(cfg), hash(other))
+        self.assertNotEqual(cfg, other)
+        other.activation_n_bits = 4
+        other.reset_hash()
+        self.assertEqual(hash(cfg), hash(other))
+        self.assertEqual(cfg, other)
+
+        hash_before = hash(cfg)
+        cfg.activation_error_method = QuantizationErrorMethod.NOCLIPPING
+        self.assertNotEqual(hash_before, hash(cfg))
+
+    def test_weights_attr_config_hash_invalidation(self):
+        cfg = _weights_config()
+        kernel_cfg = cfg.get_attr_config(KERNEL_ATTR)
+        other_kernel_cfg = _weights_config().get_attr_config(KERNEL_ATTR)
+        self.assertEqual(hash(kernel_cfg), hash(other_kernel_cfg))
+
+        cfg.set_quant_config_attr('weights_n_bits', 2, attr_name=KERNEL_ATTR)
+        self.assertNotEqual(hash(kernel_cfg), hash(other_kernel_cfg))
+        self.assertNotEqual(kernel_cfg, other_kernel_cfg)
+        other_kernel_cfg.weights_n_bits = 2
+        other_kernel_cfg.reset_hash()
+        self.assertEqual(hash(kernel_cfg), hash(other_kernel_cfg))
+
+    def test_weights_config_hash_invalidation_on_new_attr(self):
+        cfg = _weights_config()
+        hash_before = hash(cfg)
+        cfg.set_attr_config(0, copy.deepcopy(cfg.get_attr_config(KERNEL_ATTR)))
+        self.assertNotEqual(hash_before, hash(cfg))
+        self.assertEqual(hash(cfg), hash(copy.deepcopy(cfg)))
+
+    def test_filtered_candidates_equality_after_disabling_activation(self):
+        node = BaseNode(name='node', framework_attr={}, input_shape=(), output_shape=(), weights={}, layer_class=None)
+        node.candidates_quantization_cfg = []
+        for n_bits in [8, 8, 4]:
+            act_cfg = _activation_config()
+            act_cfg.activation_n_bits = n_bits
+            node.candidates_quantization_cfg.append(
+                CandidateNodeQuantizationConfig(activation_quantization_cfg=act_cfg,
+                                                weights_quantization_cfg=_weights_config()))
+
+        # Filtering hashes the configs of the candidates that the node keeps
+        node.candidates_quantization_cfg = filter_node_candidates(node, _NoKernelFwInfo())
+        self.assertEqual(len(node.candidates_quantization_cfg), 2)
+        disable_nodes_activation_quantization([node])
+
+        expected_cfgs = []
+        for c in node.candidates_quantization_cfg:
+            expected_cfg = copy.deepcopy(c.activation_quantization_cfg)
+            hash(expected_cfg)
+            self.assertFalse(expected_cfg.enable_activation_quantization)
+            self.assertEqual(c.activation_quantization_cfg, expected_cfg)
+            expected_cfgs.append(expected_cfg)
+
+        live_cfgs = [c.activation_quantization_cfg for c in node.candidates_quantization_cfg]
+        self.assertEqual(len(set(live_cfgs + expected_cfgs)), 2)
+        self.assertEqual(len(node.get_unique_activation_candidates()), 2)
+
+    def test_has_attribute_config(self):
+        cfg = _weights_config()
+        cfg.set_attr_config(0, copy.deepcopy(cfg.get_attr_config(KERNEL_ATTR)))
+        self.assertIs(cfg.has_attribute_config(KERNEL_ATTR), True)
+        self.assertIs(cfg.has_attribute_config('kernel'), True)
+        self.assertIs(cfg.has_attribute_config('gamma'), False)
+        self.assertIs(cfg.has_attribute_config(0), True)
+        self.assertIs(cfg.has_attribute_config(1), False)
+
+        cfg.set_quant_config_attr('weights_n_bits', 4, attr_name=KERNEL_ATTR)
+        self.assertEqual(cfg.get_attr_config(KERNEL_ATTR).weights_n_bits, 4)
+
+    def test_configs_copy(self):
+        cfg = _activation_config()
+        cfg.set_activation_quantization_param({'threshold': 2.0})
+        copied_cfg = copy.deepcopy(cfg)
+        self.assertFalse(hasattr(copied_cfg, '__dict__'))
+        self.assertEqual(cfg, copied_cfg)
+        self.assertEqual(cfg.get_attributes_dict(), copied_cfg.get_attributes_dict())
+        self.assertIsNot(cfg.activation_quantization_params, copied_cfg.activation_quantization_params)
+
+        hash(cfg)
+        unpickled_cfg = pickle.loads(pickle.dumps(cfg))
+        self.assertIsNone(unpickled_cfg._hash)
+        self.assertEqual(cfg, unpickled_cfg)
+
+        candidate = CandidateNodeQuantizationConfig(activation_quantization_cfg=cfg,
+                                                    weights_quantization_cfg=_weights_config())
+        copied_candidate = copy.deepcopy(candidate)
+        self.assertEqual(candidate.activation_quantization_cfg, copied_candidate.activation_quantization_cfg)
+        self.assertEqual(candidate.weights_quantization_cfg, copied_candidate.weights_quantization_cfg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+import os
+from typing import List, Any, Iterator, Tuple
+
+# Set this environment variable to run the full cartesian product of the tested configurations.
+FULL_MATRIX_ENV_VAR = 'MCT_FULL_MATRIX'
+
+
+def _pairs_of_combination(combination: Tuple[Any]) -> set:
+    return {(i, combination[i], j, combination[j])
+            for i, j in itertools.combinations(range(len(combination)), 2)}
+
+
+def pairwise_combinations(config_list: List[List[Any]]) -> Iterator[Tuple[Any]]:
+    """
+    Generates combinations of the given configuration values, such that every pair of values of any two
+    configuration parameters appears in at least one of the combinations (a pairwise covering array).
+    The combinations are selected greedily from the cartesian product, each time taking the combination that
+    covers the most uncovered pairs, so the result is deterministic.
+
+    Args:
+        config_list: A list with the possible values of each configuration parameter.
+
+    Returns:
+        An iterator over the selected combinations.
+
+    """
+    if len(config_list) < 2:
+        yield from itertools.product(*config_list)
+        return
+
+    # Configuration values are indexed by position, since they are not necessarily hashable.
+    indices_list = [range(len(values)) for values in config_list]
+    candidates = list(itertools.product(*indices_list))
+    uncovered = set().union(*(_pairs_of_combination(c) for c in candidates))
+
+    while uncovered:
+        best = max(candidates, key=lambda c: len(_pairs_of_combination(c) & uncovered))
+        uncovered -= _pairs_of_combination(best)
+        candidates.remove(best)
+        yield tuple(values[i] for values, i in zip(config_list, best))
+
+
+def get_test_combinations(config_list: List[List[Any]]) -> Iterator[Tuple[Any]]:
+    """
+    Returns the combinations of configuration values to test: a pairwise covering array by default,
+    or the full cartesian product when the MCT_FULL_MATRIX environment variable is set.
+
+    Args:
+        config_list: A list with the possible values of each configuration parameter.
+
+    Returns:
+        An iterator over the combinations to test.
+
+    """
+    if os.getenv(FULL_MATRIX_ENV_VAR):
+        return itertools.product(*config_list)
+    return pairwise_combinations(config_list)
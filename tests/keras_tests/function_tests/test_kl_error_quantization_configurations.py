@@ -72,7 +72,6 @@ class TestQuantizationConfigurations(unittest.TestCase):
                                                                                   core_config=core_config,
                                                                                   target_platform_capabilities=tpc)
 
-        model = model_gen()
         for quantize_method, error_method, relu_bound_to_power_of_2 in activation_test_combinations:
             tp = generate_test_tp_model({
                 'activation_quantization_method': quantize_method,
@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-import itertools
 import unittest
 
 import numpy as np
@@ -23,6 +22,7 @@ from tensorflow.keras import layers
 import model_compression_toolkit as mct
 from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_keras_tpc
 from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from tests.common_tests.helpers.combinations_generator import get_test_combinations
 from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
 
 
@@ -57,11 +57,11 @@ class TestQuantizationConfigurations(unittest.TestCase):
 
         weights_config_list = [quantizer_methods, quantization_error_methods, bias_correction, weights_per_channel,
                                input_scaling]
-        weights_test_combinations = list(itertools.product(*weights_config_list))
+        weights_test_combinations = get_test_combinations(weights_config_list)
 
         activation_config_list = [quantizer_methods, quantization_error_methods, relu_bound_to_power_of_2,
                                   shift_negative_correction]
-        activation_test_combinations = list(itertools.product(*activation_config_list))
+        activation_test_combinations = get_test_combinations(activation_config_list)
 
         model = model_gen()
         for quantize_method, error_method, bias_correction, per_channel, input_scaling in weights_test_combinations:
@@ -81,7 +81,6 @@ class TestQuantizationConfigurations(unittest.TestCase):
                                                                                   core_config=core_config,
                                                                                   target_platform_capabilities=tpc)
 
-        model = model_gen()
         for quantize_method, error_method, relu_bound_to_power_of_2, shift_negative_correction in activation_test_combinations:
             tp = generate_test_tp_model({
                 'activation_quantization_method': quantize_method,
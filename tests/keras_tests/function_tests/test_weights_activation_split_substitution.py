@@ -107,9 +107,6 @@ class TestWeightsActivationSplit(unittest.TestCase):
         self.assertTrue(not any([c.activation_quantization_cfg.enable_activation_quantization
                                  for c in split_weights_node.candidates_quantization_cfg]),
                         "All weights node's candidates activation quantization should be disabled.")
-        self.assertTrue(not any([c.weights_quantization_cfg.enable_weights_quantization
-                                 for c in split_activation_node.candidates_quantization_cfg]),
-                        "All activation node's candidates weights quantization should be disabled.")
 
         origin_conv = graph.get_topo_sorted_nodes()[1]
         self.assertTrue(split_weights_node.origin_node.name == origin_conv.name)
@@ -161,9 +158,6 @@ class TestWeightsActivationSplit(unittest.TestCase):
             if isinstance(n, VirtualSplitActivationNode):
                 self.assertTrue(len(n.candidates_quantization_cfg) == 3,
                                 "The activation split node should have only activation configurable candidates.")
-                self.assertTrue(not any([c.weights_quantization_cfg.enable_weights_quantization
-                                         for c in n.candidates_quantization_cfg]),
-                                "All activation node's candidates weights quantization should be disabled.")
 
     def test_non_composite_candidates_config(self):
         in_model = single_conv_model()
@@ -22,6 +22,7 @@ from torch.nn import Conv2d, ReLU
 
 import onnxruntime
 import onnx
+from onnx import numpy_helper
 
 import model_compression_toolkit as mct
 from model_compression_toolkit.constants import PYTORCH
@@ -34,10 +35,6 @@ from model_compression_toolkit import get_target_platform_capabilities
 
 DEFAULT_PYTORCH_TPC = get_target_platform_capabilities(PYTORCH, DEFAULT_TP_MODEL)
 
-_, SAVED_MODEL_PATH_PTH = tempfile.mkstemp('.pth')
-_, SAVED_MODEL_PATH_ONNX = tempfile.mkstemp('.onnx')
-_, SAVED_MP_MODEL_PATH_ONNX = tempfile.mkstemp('.onnx')
-
 
 class BasicModel(torch.nn.Module):
     def __init__(self):
@@ -51,30 +48,32 @@ class BasicModel(torch.nn.Module):
         return x
 
 
-
 class TestPyTorch2BitONNXExporter(unittest.TestCase):
 
-    def tearDown(self):
-        os.remove(SAVED_MP_MODEL_PATH_ONNX)
-
-    def repr_datagen(self):
-        for _ in range(1):
-            yield [np.random.random((1, 1, 224, 224))]
-
-    def setUp(self) -> None:
-        self.model = BasicModel()
-        self.exportable_model = self.run_mct(self.model)
-        self.exportable_model.eval()
-        pytorch_export_model(model=self.exportable_model,
-                             save_model_path=SAVED_MP_MODEL_PATH_ONNX,
-                             repr_dataset=self.repr_datagen,
+    @classmethod
+    def setUpClass(cls):
+        # The exported model is the same for all tests, so MCT and the export run once for the test class.
+        fd, cls.saved_model_path_onnx = tempfile.mkstemp('.onnx')
+        os.close(fd)
+        # Registered right away, so the file is removed even if MCT or the export fail.
+        cls.addClassCleanup(os.remove, cls.saved_model_path_onnx)
+        cls.representative_data = np.random.random((1, 1, 224, 224)).astype(np.float32)
+        cls.model = BasicModel()
+        cls.exportable_model = cls.run_mct(cls.model)
+        cls.exportable_model.eval()
+        pytorch_export_model(model=cls.exportable_model,
+                             save_model_path=cls.saved_model_path_onnx,
+                             repr_dataset=cls.repr_datagen,
                              serialization_format=mct.exporter.PytorchExportSerializationFormat.ONNX,
                              quantization_format=mct.exporter.QuantizationFormat.FAKELY_QUANT)
-        self.exported_model_onnx = onnx.load(SAVED_MP_MODEL_PATH_ONNX)
-        # Check that the model is well formed
-        onnx.checker.check_model(self.exported_model_onnx)
+        cls.exported_model_onnx = onnx.load(cls.saved_model_path_onnx)
 
-    def get_tpc(self):
+    @classmethod
+    def repr_datagen(cls):
+        yield [cls.representative_data]
+
+    @staticmethod
+    def get_tpc():
         return generate_pytorch_tpc(name="2_quant_pytorch_test",
                                     tp_model=generate_test_tp_model({'weights_n_bits': 2,
                                                                      'activation_n_bits': 8,
@@ -82,35 +81,34 @@ class TestPyTorch2BitONNXExporter(unittest.TestCase):
                                                                      'enable_activation_quantization': True
                                                                      }))
 
-    def run_mct(self, model):
+    @classmethod
+    def run_mct(cls, model):
         core_config = mct.core.CoreConfig()
         new_export_model, _ = mct.ptq.pytorch_post_training_quantization(
             in_module=model,
             core_config=core_config,
-            representative_data_gen=self.repr_datagen,
-            target_platform_capabilities=self.get_tpc())
+            representative_data_gen=cls.repr_datagen,
+            target_platform_capabilities=cls.get_tpc())
         return new_export_model
 
+    def test_onnx_model_valid(self):
+        # Check that the model is well formed
+        onnx.checker.check_model(self.exported_model_onnx)
+
     def test_onnx_inference(self):
-        ort_session = onnxruntime.InferenceSession(SAVED_MP_MODEL_PATH_ONNX, providers=['CUDAExecutionProvider', 'CPUExecutionProvider'])
+        ort_session = onnxruntime.InferenceSession(self.saved_model_path_onnx, providers=['CUDAExecutionProvider', 'CPUExecutionProvider'])
 
         def to_numpy(tensor):
             return tensor.detach().cpu().numpy() if tensor.requires_grad else tensor.cpu().numpy()
 
         # get onnx conv weight
-        conv_weight_name = 'conv1.weight'
-        from onnx import numpy_helper
-        INTIALIZERS = self.exported_model_onnx.graph.initializer
-        Weight = []
-        for initializer in INTIALIZERS:
-            if initializer.name == conv_weight_name:
-                W = numpy_helper.to_array(initializer)
-                Weight.append(W)
-
-        onnx_unique_values = np.unique(Weight[0])
+        onnx_weights = {initializer.name: numpy_helper.to_array(initializer)
+                        for initializer in self.exported_model_onnx.graph.initializer}
+
+        onnx_unique_values = np.unique(onnx_weights['conv1.weight'])
         exportable_model_unique_values = torch.unique(self.exportable_model.conv1.get_quantized_weights()
                                                       ['weight']).detach().cpu().numpy()
-        self.assertTrue(np.all(onnx_unique_values == exportable_model_unique_values))
+        self.assertTrue(np.array_equal(onnx_unique_values, exportable_model_unique_values))
 
         x = to_torch_tensor(next(self.repr_datagen()))[0]
         # compute ONNX Runtime output prediction
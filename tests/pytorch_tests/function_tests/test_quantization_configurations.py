@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-import itertools
 import unittest
 
 import numpy as np
@@ -21,6 +20,7 @@ import torch.nn
 
 import model_compression_toolkit as mct
 from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.combinations_generator import get_test_combinations
 from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
 import torch
 
@@ -64,11 +64,11 @@ class TestQuantizationConfigurations(unittest.TestCase):
         shift_negative_correction = [True, False]
 
         weights_config_list = [quantizer_methods, quantization_error_methods, bias_correction, weights_per_channel]
-        weights_test_combinations = list(itertools.product(*weights_config_list))
+        weights_test_combinations = get_test_combinations(weights_config_list)
 
         activation_config_list = [quantizer_methods, quantization_error_methods, relu_bound_to_power_of_2,
                                   shift_negative_correction]
-        activation_test_combinations = list(itertools.product(*activation_config_list))
+        activation_test_combinations = get_test_combinations(activation_config_list)
 
         model = model_gen()
         for quantize_method, error_method, bias_correction, per_channel in weights_test_combinations:
@@ -89,7 +89,6 @@ class TestQuantizationConfigurations(unittest.TestCase):
                                                               core_config=core_config,
                                                               target_platform_capabilities=tpc)
 
-        model = model_gen()
         for quantize_method, error_method, relu_bound_to_power_of_2, shift_negative_correction in activation_test_combinations:
             tp = generate_test_tp_model({
                 'activation_quantization_method': quantize_method,
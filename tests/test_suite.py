@@ -19,11 +19,13 @@ import importlib
 import unittest
 
 from tests.common_tests.function_tests.test_collectors_manipulation import TestCollectorsManipulations
+from tests.common_tests.function_tests.test_combinations_generator import TestCombinationsGenerator
 from tests.common_tests.function_tests.test_edge_matcher import TestEdgeMatcher
 #  ----------------  Individual test suites
 from tests.common_tests.function_tests.test_histogram_collector import TestHistogramCollector
 from tests.common_tests.function_tests.test_immutable_class import TestImmutableClass
 from tests.common_tests.function_tests.test_logger import TestLogger
+from tests.common_tests.function_tests.test_node_quantization_config import TestNodeQuantizationConfig
 from tests.common_tests.function_tests.test_resource_utilization_object import TestResourceUtilizationObject
 from tests.common_tests.function_tests.test_threshold_selection import TestThresholdSelection
 from tests.common_tests.test_doc_examples import TestCommonDocsExamples
@@ -107,6 +109,8 @@ if __name__ == '__main__':
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestHistogramCollector))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCollectorsManipulations))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestThresholdSelection))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestNodeQuantizationConfig))
+    suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TestCombinationsGenerator))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(TargetPlatformModelingTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(OpsetTest))
     suiteList.append(unittest.TestLoader().loadTestsFromTestCase(QCOptionsTest))